@@ -1,37 +1,41 @@
-import math
+from functools import lru_cache
 from .riichi_types import Hand
 
 MANGAN_BASE_POINT = 2000
 
+# Payout for a single multiplier at each han count that reaches mangan.
+# After 13 points is hit, we only see multiples of 13
+MANGAN_PAYOUTS = {
+    5: MANGAN_BASE_POINT,
+    6: MANGAN_BASE_POINT * 3 // 2,
+    7: MANGAN_BASE_POINT * 3 // 2,
+    8: MANGAN_BASE_POINT * 2,
+    9: MANGAN_BASE_POINT * 2,
+    10: MANGAN_BASE_POINT * 2,
+    11: MANGAN_BASE_POINT * 3,
+    12: MANGAN_BASE_POINT * 3,
+    13: MANGAN_BASE_POINT * 4,
+    26: MANGAN_BASE_POINT * 4 * 2,
+    39: MANGAN_BASE_POINT * 4 * 3,
+    52: MANGAN_BASE_POINT * 4 * 4,
+    65: MANGAN_BASE_POINT * 4 * 5,
+}
+
 
 def mangan_value(points: int) -> int:
-    multiplier = 0.
-    if points == 5:
-        multiplier = 1
-    elif points <= 7:
-        multiplier = 1.5
-    elif points <= 10:
-        multiplier = 2
-    elif points <= 12:
-        multiplier = 3
-    # After 13 points is hit, we only see multiples of 13
-    elif points == 13:
-        multiplier = 4
-    elif points == 26:
-        multiplier = 4 * 2
-    elif points == 39:
-        multiplier = 4 * 3
-    elif points == 52:
-        multiplier = 4 * 4
-    elif points == 65:
-        multiplier = 4 * 5
-    return int(MANGAN_BASE_POINT * multiplier)
+    return MANGAN_PAYOUTS.get(points, 0)
 
 
 def calculate_hand_value(multiplier: int, hand: Hand):
-    fu, han = hand.fu, hand.han
+    return _calculate_hand_value(multiplier, hand.fu, hand.han)
+
+
+@lru_cache(maxsize=4096)
+def _calculate_hand_value(multiplier: int, fu: int, han: int) -> int:
     if han >= 5:
         return mangan_value(han) * multiplier
     mangan_payout = MANGAN_BASE_POINT * multiplier
-    hand_value = math.ceil((fu * (2 ** (2 + han)) * multiplier) / 100) * 100
+    base_value = (fu * multiplier) << (2 + han)
+    # Round up to the nearest 100
+    hand_value = (base_value + 99) // 100 * 100
     return mangan_payout if hand_value > mangan_payout else hand_value
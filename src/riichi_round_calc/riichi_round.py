@@ -11,6 +11,21 @@ from .riichi_types import (
 from .points import calculate_hand_value, MANGAN_BASE_POINT
 from .helper import containing_any
 
+WINNING_TRANSACTION_TYPES = frozenset(
+    {
+        TransactionType.DEAL_IN,
+        TransactionType.SELF_DRAW,
+        TransactionType.SELF_DRAW_PAO,
+        TransactionType.DEAL_IN_PAO,
+    }
+)
+
+# The other seats in turn order, starting from the seat after each player
+SEAT_SEARCH_ORDER = tuple(
+    tuple((seat + distance) % NUM_PLAYERS for distance in range(1, NUM_PLAYERS))
+    for seat in range(NUM_PLAYERS)
+)
+
 
 def get_deal_in_multiplier(person_index: int, dealer_index: int) -> int:
     return 6 if person_index == dealer_index else 4
@@ -25,7 +40,7 @@ def get_self_draw_multiplier(person_index: int, dealer_index: int, is_dealer: bo
 def get_deal_in_transaction(
     winner_index: int, loser_index: int, dealer_index: int, hand: Hand
 ) -> Transaction:
-    score_deltas = get_empty_score_deltas()
+    score_deltas = [0] * NUM_PLAYERS
     multiplier = get_deal_in_multiplier(winner_index, dealer_index)
     hand_value = calculate_hand_value(multiplier, hand)
     score_deltas[winner_index] = hand_value
@@ -36,17 +51,15 @@ def get_deal_in_transaction(
 def get_self_draw_transaction(
     winner_index: int, dealer_index: int, hand: Hand
 ) -> Transaction:
-    score_deltas = get_empty_score_deltas()
-    is_dealer = winner_index == dealer_index
-    total_score = 0
-    for i in range(NUM_PLAYERS):
-        if i != winner_index:
-            value = calculate_hand_value(
-                get_self_draw_multiplier(i, dealer_index, is_dealer), hand
-            )
-            total_score += value
-            score_deltas[i] = -value
-    score_deltas[winner_index] = total_score
+    dealer_value = calculate_hand_value(2, hand)
+    if winner_index == dealer_index:
+        score_deltas = [-dealer_value] * NUM_PLAYERS
+        score_deltas[winner_index] = dealer_value * (NUM_PLAYERS - 1)
+    else:
+        non_dealer_value = calculate_hand_value(1, hand)
+        score_deltas = [-non_dealer_value] * NUM_PLAYERS
+        score_deltas[dealer_index] = -dealer_value
+        score_deltas[winner_index] = dealer_value + non_dealer_value * (NUM_PLAYERS - 2)
     return Transaction(TransactionType.SELF_DRAW, score_deltas, hand)
 
 
@@ -55,7 +68,7 @@ def get_in_round_ryuukyoku_transaction() -> Transaction:
 
 
 def get_nagashi_mangan_transaction(winner_index: int, dealer_index: int) -> Transaction:
-    score_deltas = get_empty_score_deltas()
+    score_deltas = [0] * NUM_PLAYERS
     is_dealer = winner_index == dealer_index
     for i in range(NUM_PLAYERS):
         if i != winner_index:
@@ -74,10 +87,11 @@ def get_deal_in_pao_transaction(
     dealer_index: int,
     hand: Hand,
 ) -> Transaction:
-    score_deltas = get_empty_score_deltas()
+    score_deltas = [0] * NUM_PLAYERS
     multiplier = get_deal_in_multiplier(winner_index, dealer_index)
-    score_deltas[deal_in_person_index] = -calculate_hand_value(multiplier // 2, hand)
-    score_deltas[pao_player_index] = -calculate_hand_value(multiplier // 2, hand)
+    half_value = calculate_hand_value(multiplier // 2, hand)
+    score_deltas[deal_in_person_index] = -half_value
+    score_deltas[pao_player_index] = -half_value
     score_deltas[winner_index] = calculate_hand_value(multiplier, hand)
     return Transaction(
         TransactionType.DEAL_IN_PAO, score_deltas, hand, pao_player_index
@@ -87,7 +101,7 @@ def get_deal_in_pao_transaction(
 def get_self_draw_pao_transaction(
     winner_index: int, pao_player_index: int, dealer_index: int, hand: Hand
 ) -> Transaction:
-    score_deltas = get_empty_score_deltas()
+    score_deltas = [0] * NUM_PLAYERS
     multiplier = get_deal_in_multiplier(winner_index, dealer_index)
     value = calculate_hand_value(multiplier, hand)
     score_deltas[pao_player_index] = -value
@@ -98,73 +112,71 @@ def get_self_draw_pao_transaction(
 
 
 def find_head_bump_winner(transactions: list[Transaction]) -> int:
-    winners = set()
-    losers = set()
+    winners = 0  # bitmask of winning seats
+    loser = None
     for transaction in transactions:
+        score_deltas = transaction.score_deltas
         for i in range(NUM_PLAYERS):
             if transaction.pao_target == i:
                 continue
-            if transaction.score_deltas[i] > 0:
-                winners.add(i)
-            elif transaction.score_deltas[i] < 0:
-                losers.add(i)
+            if score_deltas[i] > 0:
+                winners |= 1 << i
+            elif loser is None and score_deltas[i] < 0:
+                loser = i
+    if loser is None:
+        # Only a pao player paid (a lone pao tsumo), so there must be one winner
+        if winners and not winners & (winners - 1):
+            return winners.bit_length() - 1
+        raise Exception("No loser to count the head bump from")
     # Two cases:
     # Either tsumo, in which case there's only one winner
     # Or it's a double/triple ron, in which case there's only one loser
-
-    [loser, *_] = losers
-    return get_closest_winner(loser, winners)
-
-
-def get_closest_winner(loser_local_pos: int, winners: set[int]) -> int:
-    [closest_winner, *_] = winners
-    for winner in winners:
-        if (winner - loser_local_pos) % NUM_PLAYERS < (
-            closest_winner - loser_local_pos
-        ) % NUM_PLAYERS:
-            closest_winner = winner
-    return closest_winner
+    # Either way, the first winner counting around from the loser gets the head bump
+    for seat in SEAT_SEARCH_ORDER[loser]:
+        if winners & (1 << seat):
+            return seat
+    raise Exception("No winner to receive head bump")
 
 
 def generate_tenpai_score_deltas(tenpais: list[int]) -> list[int]:
-    score_deltas = get_empty_score_deltas()
-    if not tenpais or len(tenpais) == NUM_PLAYERS:
-        return score_deltas
-    for i in range(NUM_PLAYERS):
-        if i in tenpais:
-            score_deltas[i] = 3000 // len(tenpais)
-        else:
-            score_deltas[i] = -3000 // (NUM_PLAYERS - len(tenpais))
-    return score_deltas
+    tenpai_count = len(tenpais)
+    if tenpai_count == 0 or tenpai_count == NUM_PLAYERS:
+        return get_empty_score_deltas()
+    tenpai_set = set(tenpais)
+    tenpai_payout = 3000 // tenpai_count
+    noten_payment = -3000 // (NUM_PLAYERS - tenpai_count)
+    return [
+        tenpai_payout if i in tenpai_set else noten_payment for i in range(NUM_PLAYERS)
+    ]
 
 
 def reduce_score_deltas(transactions: list[Transaction]) -> list[int]:
-    result = get_empty_score_deltas()
-    for transaction in transactions:
-        for i in range(NUM_PLAYERS):
-            result[i] += transaction.score_deltas[i]
-    return result
+    if not transactions:
+        return get_empty_score_deltas()
+    return [
+        sum(player_deltas)
+        for player_deltas in zip(*(t.score_deltas for t in transactions))
+    ]
 
 
 def generate_overall_score_deltas(concluded_round: ConcludedRound) -> list[int]:
     raw_score_deltas = reduce_score_deltas(concluded_round.transactions)
     for riichi_player in concluded_round.riichis:
-        raw_score_deltas[riichi_player] -= 1000
+        raw_score_deltas[riichi_player] -= RIICHI_STICK_VALUE
     if containing_any(concluded_round.transactions, TransactionType.NAGASHI_MANGAN):
         return raw_score_deltas
-    riichi_deltas = [
-        a + b
-        for a, b in zip(
-            generate_tenpai_score_deltas(concluded_round.tenpais), raw_score_deltas
-        )
-    ]
-    if concluded_round.transactions:
+    tenpai_deltas = generate_tenpai_score_deltas(concluded_round.tenpais)
+    for i in range(NUM_PLAYERS):
+        raw_score_deltas[i] += tenpai_deltas[i]
+    if concluded_round.end_riichi_stick_count == 0 and any(
+        transaction.transaction_type in WINNING_TRANSACTION_TYPES
+        for transaction in concluded_round.transactions
+    ):
         headbump_winner = find_head_bump_winner(concluded_round.transactions)
-        if concluded_round.end_riichi_stick_count == 0:
-            riichi_deltas[headbump_winner] += (
-                concluded_round.start_riichi_stick_count + len(concluded_round.riichis)
-            ) * RIICHI_STICK_VALUE
-    return riichi_deltas
+        raw_score_deltas[headbump_winner] += (
+            concluded_round.start_riichi_stick_count + len(concluded_round.riichis)
+        ) * RIICHI_STICK_VALUE
+    return raw_score_deltas
 
 
 def transform_transactions(
@@ -173,63 +185,55 @@ def transform_transactions(
     if not transactions:
         return []
     transactions = transactions.copy()
-    transaction = determine_honba_transaction(transactions)
-    new_transaction = add_honba(transaction, honba)
-    for i in range(NUM_PLAYERS):
-        if transactions[i] == transaction:
-            transactions[i] = new_transaction
-            break
+    honba_index = determine_honba_transaction_index(transactions)
+    transactions[honba_index] = add_honba(transactions[honba_index], honba)
     return transactions
 
 
 def determine_honba_transaction(transactions: list[Transaction]) -> Transaction:
+    return transactions[determine_honba_transaction_index(transactions)]
+
+
+def determine_honba_transaction_index(transactions: list[Transaction]) -> int:
     if len(transactions) == 1:
-        return transactions[0]
-    potential_tsumo = containing_any(transactions, TransactionType.SELF_DRAW)
-    if potential_tsumo:
-        return potential_tsumo
+        return 0
+    for i, transaction in enumerate(transactions):
+        if transaction.transaction_type == TransactionType.SELF_DRAW:
+            return i
     headbump_winner = find_head_bump_winner(transactions)
-    for transaction in transactions:
+    for i, transaction in enumerate(transactions):
         if (
             transaction.score_deltas[headbump_winner] > 0
             and transaction.transaction_type == TransactionType.DEAL_IN_PAO
         ):
-            return transaction
-    for transaction in transactions:
+            return i
+    for i, transaction in enumerate(transactions):
         if transaction.score_deltas[headbump_winner] > 0:
-            return transaction
+            return i
     raise Exception("No transaction affects honba")
 
 
 def add_honba(transaction: Transaction, honba: int) -> Transaction:
     new_transaction = Transaction(
         transaction.transaction_type,
-        get_empty_score_deltas(),
+        transaction.score_deltas.copy(),
         transaction.hand,
         transaction.pao_target,
     )
-    for i in range(NUM_PLAYERS):
-        new_transaction.score_deltas[i] = transaction.score_deltas[i]
-    match new_transaction.transaction_type:
-        case TransactionType.NAGASHI_MANGAN | TransactionType.INROUND_RYUUKYOKU:
-            pass
-        case TransactionType.SELF_DRAW:
-            for i in range(NUM_PLAYERS):
-                if new_transaction.score_deltas[i] > 0:
-                    new_transaction.score_deltas[i] += 300 * honba
-                else:
-                    new_transaction.score_deltas[i] -= 100 * honba
-        case TransactionType.DEAL_IN | TransactionType.DEAL_IN_PAO:
-            handle_deal_in(new_transaction, honba)
-        case TransactionType.SELF_DRAW_PAO:
-            for i in range(NUM_PLAYERS):
-                if new_transaction.score_deltas[i] > 0:
-                    new_transaction.score_deltas[i] += 300 * honba
-                elif new_transaction.score_deltas[i] < 0:
-                    new_transaction.score_deltas[i] -= 300 * honba
+    honba_handler = HONBA_HANDLERS.get(new_transaction.transaction_type)
+    if honba_handler is not None:
+        honba_handler(new_transaction, honba)
     return new_transaction
 
 
+def handle_self_draw(transaction: Transaction, honba: int) -> None:
+    for i in range(NUM_PLAYERS):
+        if transaction.score_deltas[i] > 0:
+            transaction.score_deltas[i] += 300 * honba
+        else:
+            transaction.score_deltas[i] -= 100 * honba
+
+
 def handle_deal_in(transaction: Transaction, honba: int) -> None:
     for i in range(NUM_PLAYERS):
         if transaction.pao_target == i:
@@ -240,6 +244,23 @@ def handle_deal_in(transaction: Transaction, honba: int) -> None:
             transaction.score_deltas[i] -= 300 * honba
 
 
+def handle_self_draw_pao(transaction: Transaction, honba: int) -> None:
+    for i in range(NUM_PLAYERS):
+        if transaction.score_deltas[i] > 0:
+            transaction.score_deltas[i] += 300 * honba
+        elif transaction.score_deltas[i] < 0:
+            transaction.score_deltas[i] -= 300 * honba
+
+
+# Nagashi mangan and in-round ryuukyoku carry no honba payment
+HONBA_HANDLERS = {
+    TransactionType.SELF_DRAW: handle_self_draw,
+    TransactionType.DEAL_IN: handle_deal_in,
+    TransactionType.DEAL_IN_PAO: handle_deal_in,
+    TransactionType.SELF_DRAW_PAO: handle_self_draw_pao,
+}
+
+
 class RiichiRound:
     def __init__(self, new_round: NewRound):
         self.round_wind = new_round.round_wind
@@ -301,12 +322,7 @@ class RiichiRound:
 
     def get_final_riichi_sticks(self):
         for transaction in self.transactions:
-            if transaction.transaction_type in [
-                TransactionType.DEAL_IN,
-                TransactionType.SELF_DRAW,
-                TransactionType.SELF_DRAW_PAO,
-                TransactionType.DEAL_IN_PAO,
-            ]:
+            if transaction.transaction_type in WINNING_TRANSACTION_TYPES:
                 return 0
         return self.start_riichi_stick_count + len(self.riichis)
 
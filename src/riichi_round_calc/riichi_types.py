@@ -18,6 +18,9 @@ class Wind(Enum):
 
 
 WIND_ORDER = list(Wind)
+NEXT_WIND = {
+    wind: WIND_ORDER[(i + 1) % len(WIND_ORDER)] for i, wind in enumerate(WIND_ORDER)
+}
 
 
 class TransactionType(Enum):
@@ -38,16 +41,16 @@ def get_starting_score() -> list[int]:
 
 
 def get_next_wind(wind: Wind) -> Wind:
-    return WIND_ORDER[(WIND_ORDER.index(wind) + 1) % NUM_PLAYERS]
+    return NEXT_WIND[wind]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Hand:
     fu: int
     han: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     transaction_type: TransactionType
     score_deltas: list[int]
@@ -55,7 +58,7 @@ class Transaction:
     pao_target: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConcludedRound:
     """A concluded Riichi Round."""
 
@@ -73,7 +76,7 @@ class ConcludedRound:
         return from_dict(ConcludedRound, obj)
 
 
-@dataclass
+@dataclass(slots=True)
 class NewRound:
     round_wind: Wind
     round_number: int
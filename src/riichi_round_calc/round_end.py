@@ -11,15 +11,16 @@ from .riichi_types import (
 
 from .riichi_round import generate_overall_score_deltas
 
+HONBA_BUMP_TYPES = frozenset(
+    {TransactionType.INROUND_RYUUKYOKU, TransactionType.NAGASHI_MANGAN}
+)
+
 
 def get_new_honba_count(transactions, dealer_index, honba):
     if len(transactions) == 0:
         return honba + 1
     for transaction in transactions:
-        if transaction.transaction_type in [
-            TransactionType.INROUND_RYUUKYOKU,
-            TransactionType.NAGASHI_MANGAN,
-        ]:
+        if transaction.transaction_type in HONBA_BUMP_TYPES:
             return honba + 1
         if transaction.score_deltas[dealer_index] > 0:
             return honba + 1
@@ -67,20 +68,61 @@ def generate_next_round(concluded_round: ConcludedRound):
     )
 
 
+def tally_scores(
+    starting_score: list[int], concluded_rounds: list[ConcludedRound]
+) -> list[int]:
+    total_score = starting_score.copy()
+    for concluded_round in concluded_rounds:
+        overall_score_deltas = generate_overall_score_deltas(concluded_round)
+        for i in range(NUM_PLAYERS):
+            total_score[i] += overall_score_deltas[i]
+    return total_score
+
+
+class GameState:
+    """Running score totals, so each concluded round is only tallied once.
+
+    update_scores must always be given the same list of concluded rounds,
+    which may only be appended to; rounds already tallied are not re-read.
+    """
+
+    def __init__(self, starting_score: list[int] | None = None):
+        if starting_score is None:
+            starting_score = get_starting_score()
+        self.running_total = starting_score.copy()
+        self.last_processed_index = 0
+
+    def update_scores(self, concluded_rounds: list[ConcludedRound]) -> list[int]:
+        if len(concluded_rounds) < self.last_processed_index:
+            raise ValueError(
+                f"{self.last_processed_index} rounds were already tallied but only "
+                f"{len(concluded_rounds)} were given; concluded rounds must only grow"
+            )
+        self.running_total = tally_scores(
+            self.running_total, concluded_rounds[self.last_processed_index :]
+        )
+        self.last_processed_index = len(concluded_rounds)
+        return self.running_total
+
+
 def is_game_end(
-    new_round: NewRound, concluded_rounds: list[ConcludedRound], starting_score=None
+    new_round: NewRound,
+    concluded_rounds: list[ConcludedRound],
+    starting_score=None,
+    game_state: GameState | None = None,
 ):
-    if starting_score is None:
-        starting_score = get_starting_score()
+    if starting_score is not None and game_state is not None:
+        raise ValueError("Pass either starting_score or game_state, not both")
     if new_round.round_wind == Wind.NORTH:
         # ends at north regardless of what happens
         return True
 
-    total_score = starting_score
-    for concluded_round in concluded_rounds:
-        overall_score_deltas = generate_overall_score_deltas(concluded_round)
-        for i in range(NUM_PLAYERS):
-            total_score[i] += overall_score_deltas[i]
+    if game_state is not None:
+        total_score = game_state.update_scores(concluded_rounds)
+    else:
+        if starting_score is None:
+            starting_score = get_starting_score()
+        total_score = tally_scores(starting_score, concluded_rounds)
 
     exceeds_hanten = False
     for score in total_score:
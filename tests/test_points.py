@@ -1,6 +1,6 @@
 import pytest
 
-from riichi_round_calc.points import calculate_hand_value
+from riichi_round_calc.points import calculate_hand_value, mangan_value
 from riichi_round_calc.riichi_types import Hand
 
 
@@ -34,3 +34,25 @@ from riichi_round_calc.riichi_types import Hand
 def test_points(fu: int, han: int, multiplier: int, expected: int):
     # Multiplier = 1: Non-dealer tsumo; 2: Dealer tsumo; 4: nondealer deal-in, 6: dealer deal-in
     assert calculate_hand_value(multiplier, Hand(fu, han)) == expected
+
+
+@pytest.mark.parametrize(
+    "points, expected",
+    [
+        (5, 2000),
+        (6, 3000),
+        (7, 3000),
+        (8, 4000),
+        (9, 4000),
+        (10, 4000),
+        (11, 6000),
+        (12, 6000),
+        (13, 8000),
+        (26, 16000),
+        (39, 24000),
+        (52, 32000),
+        (65, 40000),
+    ],
+)
+def test_mangan_value(points: int, expected: int):
+    assert mangan_value(points) == expected
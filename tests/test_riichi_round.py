@@ -1,10 +1,17 @@
-from riichi_round_calc.riichi_round import RiichiRound, generate_overall_score_deltas
+import pytest
+
+from riichi_round_calc.riichi_round import (
+    RiichiRound,
+    find_head_bump_winner,
+    generate_overall_score_deltas,
+)
 from riichi_round_calc.riichi_types import (
     Wind,
     TransactionType,
     NewRound,
     Hand,
     ConcludedRound,
+    Transaction,
 )
 from riichi_round_calc.round_end import generate_next_round, is_game_end
 
@@ -1377,3 +1384,83 @@ def test_pao_deal_in_two_yakuman():
             "start_riichi_stick_count": 0,
         },
     )
+
+
+def test_final_riichi_sticks_follow_added_transactions():
+    initial_round = {
+        "round_wind": Wind.EAST,
+        "round_number": 1,
+        "honba": 0,
+        "start_riichi_stick_count": 1,
+    }
+    riichi_round = RiichiRound(NewRound.from_dict(initial_round))
+    riichi_round.set_riichis([0, 2])
+    assert riichi_round.get_final_riichi_sticks() == 3
+    riichi_round.add_inround_ryuukyoku()
+    assert riichi_round.get_final_riichi_sticks() == 3
+    riichi_round.add_deal_in(2, 0, Hand(fu=30, han=1))
+    assert riichi_round.get_final_riichi_sticks() == 0
+
+
+def test_pao_tsumo_alone_collects_riichi_sticks():
+    round_params = {
+        "round_wind": Wind.EAST,
+        "round_number": 1,
+        "honba": 0,
+        "start_riichi_stick_count": 1,
+    }
+    riichi_round = RiichiRound(NewRound.from_dict(round_params))
+    riichi_round.set_riichis([2])
+    riichi_round.add_self_draw_pao(2, 1, Hand(fu=40, han=13))
+    ending_result = riichi_round.conclude_round()
+
+    assert ending_result.end_riichi_stick_count == 0
+    assert generate_overall_score_deltas(ending_result) == [0, -32000, 33000, 0]
+
+
+@pytest.mark.parametrize(
+    "score_deltas_list, expected_winner",
+    [
+        ([[1000, 0, 0, -1000], [0, 0, 2000, -2000]], 0),
+        ([[1000, 0, -1000, 0], [0, 2000, -2000, 0]], 0),
+        ([[0, 1000, -3000, 2000]], 3),
+    ],
+)
+def test_head_bump_goes_to_first_winner_after_loser(score_deltas_list, expected_winner):
+    transactions = [
+        Transaction(TransactionType.DEAL_IN, score_deltas)
+        for score_deltas in score_deltas_list
+    ]
+    assert find_head_bump_winner(transactions) == expected_winner
+
+
+def test_head_bump_without_loser_or_single_winner_raises():
+    transactions = [
+        Transaction(TransactionType.DEAL_IN, [1000, 1000, 0, 0]),
+    ]
+    with pytest.raises(Exception, match="No loser to count the head bump from"):
+        find_head_bump_winner(transactions)
+
+
+def test_in_round_ryuukyoku_keeps_riichi_sticks():
+    initial_round = {
+        "round_wind": Wind.EAST,
+        "round_number": 1,
+        "honba": 0,
+        "start_riichi_stick_count": 1,
+    }
+    riichi_round = RiichiRound(NewRound.from_dict(initial_round))
+    riichi_round.set_riichis([0])
+    riichi_round.add_inround_ryuukyoku()
+    ending_result = riichi_round.conclude_round()
+
+    assert ending_result.end_riichi_stick_count == 2
+    assert generate_overall_score_deltas(ending_result) == [-1000, 0, 0, 0]
+    assert generate_next_round(ending_result) == NewRound.from_dict(
+        {
+            "round_wind": Wind.EAST,
+            "round_number": 1,
+            "honba": 1,
+            "start_riichi_stick_count": 2,
+        },
+    )
@@ -1,6 +1,20 @@
 import pytest
-from riichi_round_calc.riichi_round import add_honba
-from riichi_round_calc.riichi_types import TransactionType, Transaction
+from riichi_round_calc.riichi_round import add_honba, RiichiRound
+from riichi_round_calc.riichi_types import (
+    TransactionType,
+    Transaction,
+    ConcludedRound,
+    NewRound,
+    Wind,
+    Hand,
+    get_starting_score,
+)
+from riichi_round_calc.round_end import (
+    GameState,
+    generate_next_round,
+    is_game_end,
+    tally_scores,
+)
 
 
 @pytest.mark.parametrize(
@@ -54,3 +68,64 @@ def test_add_honba(
     )
     result = add_honba(transaction, 3)
     assert result.score_deltas == expected_score_deltas
+
+
+def conclude_deal_in_round(
+    round_number: int, winner_index: int, loser_index: int
+) -> ConcludedRound:
+    initial_round = {
+        "round_wind": Wind.EAST,
+        "round_number": round_number,
+        "honba": 0,
+        "start_riichi_stick_count": 0,
+    }
+    riichi_round = RiichiRound(NewRound.from_dict(initial_round))
+    riichi_round.add_deal_in(winner_index, loser_index, Hand(fu=30, han=1))
+    return riichi_round.conclude_round()
+
+
+def test_tally_scores_leaves_starting_score_untouched():
+    starting_score = get_starting_score()
+    total_score = tally_scores(starting_score, [conclude_deal_in_round(1, 2, 0)])
+    assert total_score == [24000, 25000, 26000, 25000]
+    assert starting_score == get_starting_score()
+
+
+def test_game_state_only_tallies_new_rounds():
+    concluded_rounds = [conclude_deal_in_round(1, 2, 0)]
+    game_state = GameState()
+    assert game_state.update_scores(concluded_rounds) == [24000, 25000, 26000, 25000]
+
+    concluded_rounds.append(conclude_deal_in_round(2, 0, 3))
+    assert game_state.update_scores(concluded_rounds) == [25000, 25000, 26000, 24000]
+    assert game_state.last_processed_index == 2
+    assert not is_game_end(
+        generate_next_round(concluded_rounds[-1]),
+        concluded_rounds,
+        game_state=game_state,
+    )
+
+
+def test_game_state_rejects_shrunk_rounds():
+    game_state = GameState()
+    game_state.update_scores([conclude_deal_in_round(1, 2, 0)])
+    with pytest.raises(ValueError):
+        game_state.update_scores([])
+
+
+def test_is_game_end_rejects_starting_score_with_game_state():
+    new_round = NewRound.from_dict(
+        {
+            "round_wind": Wind.EAST,
+            "round_number": 2,
+            "honba": 0,
+            "start_riichi_stick_count": 0,
+        }
+    )
+    with pytest.raises(ValueError):
+        is_game_end(
+            new_round,
+            [],
+            starting_score=[-5000, 35000, 35000, 35000],
+            game_state=GameState(),
+        )